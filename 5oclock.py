@@ -10,6 +10,7 @@ PyQt6 app that shows the COUNTRIES where it's currently 5 o'clock (5 PM local ti
 
 Requirements (install if needed):
     pip install PyQt6 pytz
+    pip install tzdata   # Windows only: zoneinfo needs an IANA database
 
 Run:
     python five_oclock_somewhere.py
@@ -17,11 +18,24 @@ Run:
 from __future__ import annotations
 
 import sys
-from datetime import datetime, timedelta, timezone
-from typing import List, Set
+from bisect import bisect_left
+from functools import lru_cache
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo, available_timezones
 
 import pytz
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve
+from PyQt6.QtCore import (
+    Qt,
+    QTimer,
+    QPropertyAnimation,
+    QEasingCurve,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+    pyqtSlot,
+)
 from PyQt6.QtGui import QAction, QFont
 from PyQt6.QtWidgets import (
     QApplication,
@@ -37,30 +51,155 @@ from PyQt6.QtWidgets import (
 APP_TITLE = "It's 5 O'Clock Somewhere"
 TARGET_HOUR = 17  # 5 PM
 
+# Stylesheets, built once and shared by every window/toast instance.
+_ROOT_QSS = """
+QWidget#root {
+    background: qlineargradient(spread:pad, x1:0, y1:1, x2:0, y2:0,
+    stop:0 #E9D59C,
+    stop:0.5 #64B8B1,
+    stop:1 #22BED9);
+    color: #256940;
+}
+QMenuBar { background: transparent; border: none; color: #256940; }
+QMenuBar::item { padding: 6px 10px; }
+QLabel { color: #256940; }
+
+QListWidget { border: none; background: transparent; color: #256940; }
+QListWidget::item { background: transparent; border: none; padding: 2px 0; margin: 0;}
+QListWidget::item:selected { background: transparent; }
+"""
+
+_TOAST_QSS = """
+QLabel#toast {
+    background-color: rgba(20, 24, 28, 220);
+    color: #e6ebef;
+    border: 1px solid rgba(255,255,255,30);
+    border-radius: 10px;
+    padding: 8px 12px;
+    font-weight: 600;
+}
+"""
+
+# Inverted index of pytz.country_timezones: tzname -> owning country code(s).
+_owners: Dict[str, Set[str]] = {}
+for _cc, _zones in pytz.country_timezones.items():
+    for _z in _zones:
+        _owners.setdefault(_z, set()).add(_cc)
+TZ_TO_COUNTRIES: Dict[str, FrozenSet[str]] = {z: frozenset(ccs) for z, ccs in _owners.items()}
+del _owners, _cc, _zones, _z
+
+# Display names keyed by country code, uppercased once. Covers every code that can
+# come out of TZ_TO_COUNTRIES, falling back to the bare code when pytz has no name.
+CC_TO_UPPER_NAME: Dict[str, str] = {
+    cc: (pytz.country_names.get(cc) or cc).upper()
+    for cc in set(pytz.country_names) | set(pytz.country_timezones)
+}
+
+# (tzname, tzinfo) pairs, resolved once instead of on every refresh. zoneinfo does the
+# offset lookups in C; pytz is kept only for its country tables. Only zones that own a
+# country are kept: country_timezones lists canonical zones, so this drops the ~200
+# aliases (US/Eastern, Etc/GMT+5, ...) that could never contribute a country anyway.
+_TZ_OBJECTS: List[Tuple[str, tzinfo]] = [
+    (n, ZoneInfo(n)) for n in sorted(available_timezones() & TZ_TO_COUNTRIES.keys())
+]
+_TZ_NAMES: Tuple[str, ...] = tuple(n for n, _ in _TZ_OBJECTS)
+
+
+def _utc_offset_seconds(tz: tzinfo, now_utc: datetime) -> int:
+    """Return tz's UTC offset in seconds at the given aware UTC instant.
+
+    Converting from the UTC instant resolves the offset unambiguously, unlike
+    utcoffset() on a wall-clock value, which is misled by DST gaps/overlaps.
+    """
+    return int(now_utc.astimezone(tz).utcoffset().total_seconds())
+
+
+# Per-UTC-date zone offsets, aligned with _TZ_OBJECTS: (offsets at 00:00 UTC, indices of
+# zones whose offset changes during that day). Only those few zones are re-resolved on
+# each refresh; everything else is reused for the whole day.
+_OFFSET_CACHE: Dict[date, Tuple[List[int], List[int]]] = {}
+
+
+def _zone_offsets(now_utc: datetime) -> List[int]:
+    """Return every zone's UTC offset in seconds at now_utc, in _TZ_OBJECTS order."""
+    day = now_utc.date()
+    cached = _OFFSET_CACHE.get(day)
+    if cached is None:
+        midnight = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+        start = [_utc_offset_seconds(tz, midnight) for _, tz in _TZ_OBJECTS]
+        end = [_utc_offset_seconds(tz, midnight + timedelta(days=1)) for _, tz in _TZ_OBJECTS]
+        changing = [i for i, (a, b) in enumerate(zip(start, end)) if a != b]
+        for stale in [d for d in _OFFSET_CACHE if abs((d - day).days) > 2]:
+            del _OFFSET_CACHE[stale]
+        cached = _OFFSET_CACHE[day] = (start, changing)
+
+    offsets, changing = cached
+    if changing:
+        offsets = list(offsets)
+        for i in changing:
+            offsets[i] = _utc_offset_seconds(_TZ_OBJECTS[i][1], now_utc)
+    return offsets
 
-def countries_at_five_now() -> List[str]:
+
+def countries_at_five_now(now_utc: Optional[datetime] = None) -> List[str]:
     """Return a sorted list of COUNTRY NAMES where it is currently 5 PM (any minute).
 
-    We iterate through all pytz time zones, check local hour==17, then map those zones
-    to the owning country/countries via pytz.country_timezones. Duplicates removed.
+    Pass now_utc (an aware UTC datetime) to reuse a timestamp the caller already has.
+    """
+    if now_utc is None:
+        now_utc = datetime.now(timezone.utc)
+    quarter = (now_utc.hour * 60 + now_utc.minute) // 15
+    return list(_countries_at_five(now_utc.toordinal(), quarter))
+
+
+@lru_cache(maxsize=192)
+def _countries_at_five(utc_date_ordinal: int, utc_quarter: int) -> Tuple[str, ...]:
+    """Country names at 5 PM for a UTC date and quarter-hour of that day (0-95).
+
+    Every current zone offset is a multiple of 15 minutes, so the answer is fixed for
+    the whole quarter-hour and can be cached; manual refreshes within it are free.
+
+    We test the hour once per distinct UTC offset (a few dozen instead of hundreds of zones),
+    keep the zones sitting on a matching offset, then map them to the owning
+    country/countries via TZ_TO_COUNTRIES. Duplicates removed.
     """
-    now_utc = datetime.now(timezone.utc)
+    now_utc = datetime.fromordinal(utc_date_ordinal).replace(tzinfo=timezone.utc)
+    now_utc += timedelta(minutes=utc_quarter * 15)
+    utc_seconds = utc_quarter * 15 * 60
+
+    # Bind module globals to locals for the loops below (LOAD_FAST instead of LOAD_GLOBAL).
+    target = TARGET_HOUR
+    owners = TZ_TO_COUNTRIES
+    upper_names = CC_TO_UPPER_NAME
+
+    offsets = _zone_offsets(now_utc)
+    matching = {o for o in set(offsets) if (utc_seconds + o) // 3600 % 24 == target}
 
     country_codes: Set[str] = set()
-    for tzname in pytz.all_timezones:
-        tz = pytz.timezone(tzname)
-        local_now = now_utc.astimezone(tz)
-        if local_now.hour != TARGET_HOUR:
+    for tzname, offset in zip(_TZ_NAMES, offsets):
+        if offset not in matching:
             continue
-        owners = [cc for cc, zones in pytz.country_timezones.items() if tzname in zones]
-        if not owners:
-            continue
-        country_codes.update(owners)
+        country_codes |= owners[tzname]
+
+    return tuple(sorted({upper_names[cc] for cc in country_codes}))
 
-    names = [pytz.country_names.get(cc, cc) for cc in country_codes]
-    names = [n.upper() for n in names if n]
-    names.sort()
-    return names
+
+class _RefreshSignals(QObject):
+    """Carries a worker's result back to the GUI thread (queued across threads)."""
+
+    finished = pyqtSignal(list, object)  # names, the UTC time they were computed for
+
+
+class RefreshWorker(QRunnable):
+    """Computes countries_at_five_now() on a pool thread; never touches widgets."""
+
+    def __init__(self, now_utc: datetime):
+        super().__init__()
+        self.now_utc = now_utc
+        self.signals = _RefreshSignals()
+
+    def run(self):
+        self.signals.finished.emit(countries_at_five_now(self.now_utc), self.now_utc)
 
 
 class ToastLabel(QLabel):
@@ -69,18 +208,7 @@ class ToastLabel(QLabel):
     def __init__(self, parent: QWidget):
         super().__init__(parent)
         self.setObjectName("toast")
-        self.setStyleSheet(
-            """
-            QLabel#toast {
-                background-color: rgba(20, 24, 28, 220);
-                color: #e6ebef;
-                border: 1px solid rgba(255,255,255,30);
-                border-radius: 10px;
-                padding: 8px 12px;
-                font-weight: 600;
-            }
-            """
-        )
+        self.setStyleSheet(_TOAST_QSS)
         self.setVisible(False)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         self.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
@@ -88,8 +216,11 @@ class ToastLabel(QLabel):
         self.setGraphicsEffect(self._effect)
         self._anim = QPropertyAnimation(self._effect, b"opacity", self)
         self._anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
+        self._anim.finished.connect(self._on_fade_done)
+        self._fade_ms = 600
         self._hold_timer = QTimer(self)
         self._hold_timer.setSingleShot(True)
+        self._hold_timer.timeout.connect(self._start_fade)
 
     def reposition(self):
         if not self.parent():
@@ -108,25 +239,19 @@ class ToastLabel(QLabel):
         self._effect.setOpacity(1.0)
 
         # After a short hold, fade out and hide
-        def start_fade():
-            self._anim.stop()
-            self._anim.setDuration(max(100, fade_ms))
-            self._anim.setStartValue(1.0)
-            self._anim.setEndValue(0.0)
-            def on_done():
-                self.setVisible(False)
-            try:
-                self._anim.finished.disconnect()
-            except Exception:
-                pass
-            self._anim.finished.connect(on_done)
-            self._anim.start()
-
-        self._hold_timer.stop()
-        self._hold_timer.timeout.disconnect() if self._hold_timer.receivers(self._hold_timer.timeout) else None
-        self._hold_timer.timeout.connect(start_fade)
+        self._fade_ms = fade_ms
         self._hold_timer.start(max(0, duration_ms - fade_ms))
 
+    def _start_fade(self):
+        self._anim.stop()
+        self._anim.setDuration(max(100, self._fade_ms))
+        self._anim.setStartValue(1.0)
+        self._anim.setEndValue(0.0)
+        self._anim.start()
+
+    def _on_fade_done(self):
+        self.setVisible(False)
+
 
 class FiveOClockBoard(QWidget):
     def __init__(self):
@@ -159,12 +284,13 @@ class FiveOClockBoard(QWidget):
         except Exception:
             pass
         self.board.setSpacing(0)
+        self._current_names: List[str] = []  # mirrors the board rows (empty while the placeholder shows)
 
         # Use a bold, monospaced font to mimic a board
-        board_font = QFont("Courier New")
-        if not board_font.exactMatch():
-            board_font = QFont("Monospace")
-            board_font.setStyleHint(QFont.StyleHint.TypeWriter)
+        # Family fallbacks + style hint let Qt substitute without an exactMatch() font scan.
+        board_font = QFont()
+        board_font.setFamilies(["Courier New", "Monospace", "monospace"])
+        board_font.setStyleHint(QFont.StyleHint.TypeWriter)
         board_font.setPointSize(14)
         board_font.setBold(True)
         board_font.setLetterSpacing(QFont.SpacingType.PercentageSpacing, 110)
@@ -179,9 +305,16 @@ class FiveOClockBoard(QWidget):
         # Toast overlay for "Last updated" notifications
         self.toast = ToastLabel(self)
 
+        # Country lookups run off the GUI thread. A single worker keeps refreshes in order
+        # and serializes access to the module-level offset cache.
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._workers: List[RefreshWorker] = []  # keeps each worker's signals alive until delivered
+
         # Timers: refresh immediately, then exactly at each top-of-hour thereafter
         self._hourly_timer = QTimer(self)
         self._hourly_timer.setSingleShot(True)
+        self._hourly_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self._hourly_timer.timeout.connect(self._on_hour_boundary)
 
         self.refresh()
@@ -196,57 +329,77 @@ class FiveOClockBoard(QWidget):
         # App-wide style with a single solid background color and simple list styling.
         # We target the root widget by objectName for reliable background rendering.
         self.setObjectName("root")
-        self.setStyleSheet(
-            """
-            QWidget#root {
-                background: qlineargradient(spread:pad, x1:0, y1:1, x2:0, y2:0,
-                stop:0 #E9D59C,
-                stop:0.5 #64B8B1,
-                stop:1 #22BED9);
-                color: #256940; 
-            }
-            QMenuBar { background: transparent; border: none; color: #256940; }
-            QMenuBar::item { padding: 6px 10px; }
-            QLabel { color: #256940; }
-
-            QListWidget { border: none; background: transparent; color: #256940; }
-            QListWidget::item { background: transparent; border: none; padding: 2px 0; margin: 0;}
-            QListWidget::item:selected { background: transparent; }
-            """
-        )
+        self.setStyleSheet(_ROOT_QSS)
 
     def _schedule_next_hour_refresh(self):
-        # Compute seconds until the next top-of-hour and arm a single-shot timer.
-        now = datetime.now()
-        next_hour = (now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1))
-        seconds = max(1, int((next_hour - now).total_seconds()))
-        self._hourly_timer.start(seconds * 1000)
+        # Remember the next local top-of-hour as an aware UTC instant (immune to DST
+        # wall-clock repeats) and arm a single-shot timer for it.
+        now = datetime.now(timezone.utc)
+        local_hour = now.astimezone().replace(minute=0, second=0, microsecond=0)
+        self._expected_fire_time = (local_hour + timedelta(hours=1)).astimezone(timezone.utc)
+        self._arm_hourly_timer(now)
+
+    def _arm_hourly_timer(self, now: datetime):
+        # Round up so we never wake just before the boundary.
+        remaining_ms = -(-(self._expected_fire_time - now) // timedelta(milliseconds=1))
+        self._hourly_timer.start(max(1, remaining_ms))
 
     def _on_hour_boundary(self):
+        # Timers can be coalesced or throttled by the OS; if we woke early, wait out the rest.
+        now = datetime.now(timezone.utc)
+        if now < self._expected_fire_time:
+            self._arm_hourly_timer(now)
+            return
         # At the hour boundary, refresh, then schedule the next one again (keeps us aligned across DST shifts)
         self.refresh()
         self._schedule_next_hour_refresh()
 
-    def refresh(self):
-        # Build list of countries
-        names = countries_at_five_now()
-
-        self.board.clear()
+    def _update_board(self, names: List[str]):
+        # Only touch rows that changed; consecutive hours usually differ by a handful of countries.
         if not names:
+            self.board.clear()
             self.board.addItem(QListWidgetItem("NO COUNTRIES AT 5 PM RIGHT NOW"))
-        else:
-            for name in names:
-                item = QListWidgetItem(name)
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-                self.board.addItem(item)
+            self._current_names = []
+            return
+        if not self._current_names:
+            self.board.clear()  # drop the placeholder row, if any
+
+        keep = set(names)
+        for row in reversed(range(len(self._current_names))):
+            if self._current_names[row] not in keep:
+                self.board.takeItem(row)
+                del self._current_names[row]
+
+        present = set(self._current_names)
+        for name in names:
+            if name in present:
+                continue
+            row = bisect_left(self._current_names, name)
+            item = QListWidgetItem(name)
+            item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+            self.board.insertItem(row, item)
+            self._current_names.insert(row, name)
+
+    def refresh(self):
+        # Build list of countries on the worker pool; _apply_names picks up the result.
+        worker = RefreshWorker(datetime.now(timezone.utc))
+        worker.signals.finished.connect(self._apply_names)
+        self._workers.append(worker)
+        self._pool.start(worker)
+
+    @pyqtSlot(list, object)
+    def _apply_names(self, names: List[str], now_utc: datetime):
+        # Runs on the GUI thread once a worker finishes.
+        if self._workers:
+            self._workers.pop(0)
+        self._update_board(names)
 
         # Show a toast with the current update time (UTC + local)
-        local_now = datetime.now().astimezone()
-        utc_now = datetime.now(timezone.utc)
+        local_now = now_utc.astimezone()
         local_tz = local_now.tzname()
         msg = (
             f"Last updated: {local_now.strftime('%Y-%m-%d %H:%M:%S')} {local_tz} · "
-            f"UTC {utc_now.strftime('%Y-%m-%d %H:%M:%S')}"
+            f"UTC {now_utc.strftime('%Y-%m-%d %H:%M:%S')}"
         )
         self.toast.show_message(msg)
 